@@ -2,6 +2,12 @@
 import os
 import sys
 import json
+import struct
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 PIPELINE_ROOT = os.environ.get("DOC_PIPELINE_ROOT", os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 sys.path.append(os.path.join(PIPELINE_ROOT, "skills"))
@@ -11,6 +17,29 @@ import doc_inventory
 import multi_lang_api_extractor
 import markdown_renderer
 
+# With --framed, each message is a 4-byte little-endian payload length
+# followed by a JSON payload. Without it, one JSON object per line.
+FRAME_HEADER = struct.Struct("<I")
+# Rejects headers that are really stray text (e.g. a line-mode client) before
+# they turn into a multi-gigabyte read.
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _dumps(obj):
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+
+def _read_exact(stream, size):
+    chunks = []
+    while size:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
 def handle_request(request):
     tool = request.get("tool")
     params = request.get("params") or {}
@@ -26,7 +55,8 @@ def handle_request(request):
         manifest = params.get("manifest")
         if not manifest:
             manifest = doc_manifest.build_manifest(root)
-        return multi_lang_api_extractor.extract_api(manifest)
+        # The wire format is a list of item dicts, so skip the columnar model.
+        return {"api_model": multi_lang_api_extractor.extract_items(manifest)}
 
     if tool == "markdown_renderer.render_api_docs":
         api_model = params.get("api_model") or []
@@ -35,8 +65,31 @@ def handle_request(request):
 
     return {"error": f"Unknown tool: {tool}"}
 
-def main():
-    print("[DOC-PIPELINE-MULTILANG-MCP] Server started.", file=sys.stderr)
+def _write_frame(stdout, resp):
+    out = _dumps(resp)
+    stdout.write(FRAME_HEADER.pack(len(out)) + out)
+    stdout.flush()
+
+def serve_framed():
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    while True:
+        header = _read_exact(stdin, FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            break
+        (size,) = FRAME_HEADER.unpack(header)
+        if size > MAX_FRAME_SIZE:
+            # The stream cannot be resynchronized, so answer and stop.
+            _write_frame(stdout, {"error": f"Frame of {size} bytes exceeds limit of {MAX_FRAME_SIZE} bytes"})
+            break
+        payload = _read_exact(stdin, size)
+        try:
+            resp = handle_request(_loads(payload))
+        except Exception as exc:
+            resp = {"error": str(exc)}
+        _write_frame(stdout, resp)
+
+def serve_lines():
     for line in sys.stdin:
         line = line.strip()
         if not line:
@@ -49,5 +102,12 @@ def main():
         sys.stdout.write(json.dumps(resp) + "\n")
         sys.stdout.flush()
 
+def main():
+    print("[DOC-PIPELINE-MULTILANG-MCP] Server started.", file=sys.stderr)
+    if "--framed" in sys.argv[1:]:
+        serve_framed()
+    else:
+        serve_lines()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,86 @@
+
+"""api_model.py
+
+Columnar (structure-of-arrays) container for the normalized `api_model`.
+
+Item fields live in parallel lists indexed by item, and members of all items
+are flattened into parallel member lists; `member_offsets[i]` and
+`member_offsets[i + 1]` bound the members of item `i`. Iterating yields the
+familiar item dicts, built only when requested, and `to_list()` gives the
+JSON-ready list-of-dicts form exchanged by the MCP tools.
+"""
+
+from typing import Dict, Any, Iterable, Iterator, List
+
+class ApiModel:
+    def __init__(self) -> None:
+        self.files: List[str] = []
+        self.languages: List[str] = []
+        self.containers: List[str] = []
+        self.container_kinds: List[str] = []
+        self.summaries: List[str] = []
+
+        self.member_offsets: List[int] = [0]
+        self.member_names: List[str] = []
+        self.member_kinds: List[str] = []
+        self.member_visibilities: List[str] = []
+        self.member_parameters: List[List[Any]] = []
+        self.member_returns: List[str] = []
+        self.member_summaries: List[str] = []
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]]) -> "ApiModel":
+        model = cls()
+        model.extend(items)
+        return model
+
+    def append(self, item: Dict[str, Any]) -> None:
+        self.files.append(item.get("file", ""))
+        self.languages.append(item.get("language", "unknown"))
+        self.containers.append(item.get("container", "UnknownContainer"))
+        self.container_kinds.append(item.get("container_kind", "unknown"))
+        self.summaries.append(item.get("summary", ""))
+
+        for m in item.get("members", []):
+            self.member_names.append(m["name"])
+            self.member_kinds.append(m.get("kind", "unknown"))
+            self.member_visibilities.append(m.get("visibility", "public"))
+            self.member_parameters.append(m.get("parameters", []))
+            self.member_returns.append(m.get("returns", "unknown"))
+            self.member_summaries.append(m.get("summary", ""))
+        self.member_offsets.append(len(self.member_names))
+
+    def extend(self, items: Iterable[Dict[str, Any]]) -> None:
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def item(self, i: int) -> Dict[str, Any]:
+        lo, hi = self.member_offsets[i], self.member_offsets[i + 1]
+        members = []
+        for j in range(lo, hi):
+            members.append({
+                "name": self.member_names[j],
+                "kind": self.member_kinds[j],
+                "visibility": self.member_visibilities[j],
+                "parameters": self.member_parameters[j],
+                "returns": self.member_returns[j],
+                "summary": self.member_summaries[j]
+            })
+        return {
+            "file": self.files[i],
+            "language": self.languages[i],
+            "container": self.containers[i],
+            "container_kind": self.container_kinds[i],
+            "summary": self.summaries[i],
+            "members": members
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self.item(i)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
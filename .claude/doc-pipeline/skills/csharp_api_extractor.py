@@ -4,48 +4,67 @@
 Minimal heuristic-based extractor for C#.
 """
 
-import re
+import mmap
 from typing import Dict, Any, List
 
-CLASS_PATTERN = re.compile(r'public\s+class\s+(\w+)')
-NAMESPACE_PATTERN = re.compile(r'namespace\s+([\w\.]+)')
-METHOD_PATTERN = re.compile(r'public\s+(?:async\s+)?[\w<>,\[\]]+\s+(\w+)\s*\(')
+from regex_engine import compile_pattern, group_text, last_group
 
-def extract(files: List[str]) -> Dict[str, Any]:
+# One alternation per language so each file is scanned once; the named group
+# that matched (`last_group(m)`) tells which construct was found.
+# Bytes-mode `\w` is ASCII-only, so `\x80-\xff` admits UTF-8 encoded
+# identifiers such as `Café`.
+CSHARP_PATTERN = compile_pattern(
+    rb'namespace\s+(?P<namespace>[\w\x80-\xff\.]+)'
+    rb'|public\s+class\s+(?P<cls>[\w\x80-\xff]+)'
+    rb'|public\s+(?:async\s+)?[\w\x80-\xff<>,\[\]]+\s+(?P<method>[\w\x80-\xff]+)\s*\('
+)
+
+def extract_bytes(path: str, data: Any) -> List[Dict[str, Any]]:
+    """Extract from `data`, the file's content as bytes or any buffer (e.g. an mmap)."""
     api_model: List[Dict[str, Any]] = []
 
-    for path in files:
-        try:
-            with open(path, encoding="utf-8") as f:
-                text = f.read()
-        except Exception:
-            continue
-
-        namespace_match = NAMESPACE_PATTERN.search(text)
-        namespace = namespace_match.group(1) if namespace_match else ""
-
-        for c in CLASS_PATTERN.finditer(text):
-            class_name = c.group(1)
-            class_block = text[c.start():]
-            members = []
-            for m in METHOD_PATTERN.finditer(class_block):
-                members.append({
-                    "name": m.group(1),
-                    "kind": "method",
-                    "visibility": "public",
-                    "parameters": [],
-                    "returns": "unknown",
-                    "summary": ""
-                })
-
-            container = f"{namespace}.{class_name}" if namespace else class_name
-            api_model.append({
+    namespace = ""
+    current = None
+    matches = [(last_group(m), group_text(m, m.lastindex)) for m in CSHARP_PATTERN.finditer(data)]
+
+    for kind, name in matches:
+        if kind == "namespace":
+            namespace = name
+        elif kind == "cls":
+            container = f"{namespace}.{name}" if namespace else name
+            current = {
                 "file": path,
                 "language": "csharp",
                 "container": container,
                 "container_kind": "class",
                 "summary": "",
-                "members": members
+                "members": []
+            }
+            api_model.append(current)
+        elif current is not None:
+            # Methods belong to the closest preceding class.
+            current["members"].append({
+                "name": name,
+                "kind": "method",
+                "visibility": "public",
+                "parameters": [],
+                "returns": "unknown",
+                "summary": ""
             })
 
+    return api_model
+
+def extract_one(path: str) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        return []
+    with buf:
+        return extract_bytes(path, buf)
+
+def extract(files: List[str]) -> Dict[str, Any]:
+    api_model: List[Dict[str, Any]] = []
+    for path in files:
+        api_model.extend(extract_one(path))
     return {"api_model": api_model}
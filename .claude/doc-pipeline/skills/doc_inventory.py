@@ -8,21 +8,32 @@ Responsibility:
 """
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple
+
+EXCLUDED_DIRS = {".git"}
+
+def _walk(root: str, in_api: bool) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """Yield `(file entry, in_api)` below `root`, pruning excluded directories
+    by name. `in_api` is set once a directory named `api` has been entered."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDED_DIRS:
+                    yield from _walk(entry.path, in_api or entry.name.lower() == "api")
+            elif entry.is_file():
+                yield entry, in_api
 
 def scan_docs(root: str = ".") -> Dict[str, Any]:
     docs: List[Dict[str, Any]] = []
 
-    for dirpath, dirnames, filenames in os.walk(root):
-        if ".git" in dirpath:
+    root_parts = os.path.normpath(root).replace("\\", "/").lower().split("/")
+    for entry, in_api in _walk(root, "api" in root_parts):
+        if not entry.name.lower().endswith(".md"):
             continue
-        for filename in filenames:
-            if filename.lower().endswith(".md"):
-                rel_path = os.path.join(dirpath, filename)
-                kind = "generic"
-                normalized = rel_path.replace("\\", "/").lower()
-                if "/api/" in normalized:
-                    kind = "api"
-                docs.append({"path": rel_path, "kind": kind})
+        docs.append({"path": entry.path, "kind": "api" if in_api else "generic"})
 
     return {"docs": docs}
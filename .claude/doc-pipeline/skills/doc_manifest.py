@@ -9,7 +9,7 @@ Multi-language version:
 """
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 
 EXT_LANGUAGE_MAP = {
     ".cs": "csharp",
@@ -35,25 +35,53 @@ def infer_language_from_extension(path: str) -> str:
     _, ext = os.path.splitext(path)
     return EXT_LANGUAGE_MAP.get(ext.lower(), "unknown")
 
+EXCLUDED_DIRS = {".git", "node_modules", "bin", "obj"}
+
+def _walk(root: str) -> Iterator[os.DirEntry]:
+    """Yield every file and non-excluded directory entry below `root`.
+
+    Excluded directories are pruned by exact name before descending, and
+    `DirEntry` type checks reuse the readdir result instead of calling stat.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in EXCLUDED_DIRS:
+                    continue
+                yield entry
+                yield from _walk(entry.path)
+            elif entry.is_file():
+                yield entry
+
 def build_manifest(root: str = ".") -> Dict[str, Any]:
     sources: List[Dict[str, str]] = []
     doc_dirs: List[str] = []
 
-    for dirpath, dirnames, filenames in os.walk(root):
-        if ".git" in dirpath or "node_modules" in dirpath or "bin" in dirpath or "obj" in dirpath:
+    if os.path.basename(root).lower() == "docs":
+        doc_dirs.append(root)
+
+    for entry in _walk(root):
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name.lower() == "docs":
+                doc_dirs.append(entry.path)
             continue
 
-        if os.path.basename(dirpath).lower() == "docs":
-            doc_dirs.append(dirpath)
-
-        for filename in filenames:
-            rel_path = os.path.join(dirpath, filename)
-            language = infer_language_from_extension(rel_path)
-            if language != "unknown":
-                sources.append({
-                    "path": rel_path,
-                    "language": language
-                })
+        # rfind + slice is cheaper than splitext; a leading dot (".bashrc")
+        # is a hidden file, not an extension.
+        name = entry.name
+        dot = name.rfind(".")
+        if dot <= 0:
+            continue
+        language = EXT_LANGUAGE_MAP.get(name[dot:].lower())
+        if language is not None:
+            sources.append({
+                "path": entry.path,
+                "language": language
+            })
 
     return {
         "sources": sources,
@@ -12,15 +12,24 @@ Strategy:
 import os
 from typing import Dict, Any, List
 
+# Output depends only on the path, so callers need not read the file.
+READS_SOURCE = False
+
+def extract_bytes(path: str, data: bytes) -> List[Dict[str, Any]]:
+    return extract_one(path)
+
+def extract_one(path: str) -> List[Dict[str, Any]]:
+    return [{
+        "file": path,
+        "language": "unknown",
+        "container": os.path.basename(path),
+        "container_kind": "file",
+        "summary": "",
+        "members": []
+    }]
+
 def extract(files: List[str]) -> Dict[str, Any]:
     api_model: List[Dict[str, Any]] = []
     for path in files:
-        api_model.append({
-            "file": path,
-            "language": "unknown",
-            "container": os.path.basename(path),
-            "container_kind": "file",
-            "summary": "",
-            "members": []
-        })
+        api_model.extend(extract_one(path))
     return {"api_model": api_model}
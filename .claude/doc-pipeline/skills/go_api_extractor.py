@@ -4,48 +4,78 @@
 Minimal heuristic-based extractor for Go.
 """
 
-import re
+import mmap
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 
-FUNC_PATTERN = re.compile(r'^func\s+(?:\(.*?\)\s*)?(\w+)\s*\(', re.MULTILINE)
+from regex_engine import compile_pattern, group_text
 
-def extract(files: List[str]) -> Dict[str, Any]:
+# Matched only at offsets found by `_line_starts`, which stands in for `(?m)^`.
+FUNC_PATTERN = compile_pattern(rb'func\s+(?:\(.*?\)\s*)?([\w\x80-\xff]+)\s*\(')
+
+def _line_starts(buf: Any, literal: bytes) -> Iterator[int]:
+    """Offsets of lines beginning with `literal`.
+
+    A `^`-anchored pattern gives the regex engine no literal prefix to search
+    for, so it tries every position; `find` on the literal runs in C.
+    """
+    if buf[:len(literal)] == literal:
+        yield 0
+    needle = b"\n" + literal
+    pos = buf.find(needle)
+    while pos != -1:
+        yield pos + 1
+        pos = buf.find(needle, pos + 1)
+
+def extract_bytes(path: str, data: Any) -> List[Dict[str, Any]]:
+    """Extract from `data`, the file's content as bytes or any buffer (e.g. an mmap)."""
     api_model: List[Dict[str, Any]] = []
 
-    for path in files:
-        try:
-            with open(path, encoding="utf-8") as f:
-                text = f.read()
-        except Exception:
-            continue
-
-        funcs = FUNC_PATTERN.findall(text)
-        if not funcs:
-            continue
-
-        members = []
-        for name in funcs:
-            if name and name[0].isupper():
-                members.append({
-                    "name": name,
-                    "kind": "function",
-                    "visibility": "public",
-                    "parameters": [],
-                    "returns": "unknown",
-                    "summary": ""
-                })
-
-        if not members:
-            continue
-
-        api_model.append({
-            "file": path,
-            "language": "go",
-            "container": os.path.basename(path),
-            "container_kind": "module",
-            "summary": "",
-            "members": members
-        })
+    funcs = []
+    for start in _line_starts(data, b"func"):
+        m = FUNC_PATTERN.match(data, start)
+        if m:
+            funcs.append(group_text(m))
+    if not funcs:
+        return api_model
+
+    members = []
+    for name in funcs:
+        if name and name[0].isupper():
+            members.append({
+                "name": name,
+                "kind": "function",
+                "visibility": "public",
+                "parameters": [],
+                "returns": "unknown",
+                "summary": ""
+            })
+
+    if not members:
+        return api_model
 
+    api_model.append({
+        "file": path,
+        "language": "go",
+        "container": os.path.basename(path),
+        "container_kind": "module",
+        "summary": "",
+        "members": members
+    })
+
+    return api_model
+
+def extract_one(path: str) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        return []
+    with buf:
+        return extract_bytes(path, buf)
+
+def extract(files: List[str]) -> Dict[str, Any]:
+    api_model: List[Dict[str, Any]] = []
+    for path in files:
+        api_model.extend(extract_one(path))
     return {"api_model": api_model}
@@ -4,34 +4,51 @@
 Minimal heuristic-based extractor for Java.
 """
 
-import re
+import mmap
 from typing import Dict, Any, List
 
-CLASS_PATTERN = re.compile(r'public\s+class\s+(\w+)')
-PACKAGE_PATTERN = re.compile(r'package\s+([\w\.]+);')
+from regex_engine import compile_pattern, group_text, last_group
 
-def extract(files: List[str]) -> Dict[str, Any]:
+JAVA_PATTERN = compile_pattern(
+    rb'package\s+(?P<package>[\w\x80-\xff\.]+);'
+    rb'|public\s+class\s+(?P<cls>[\w\x80-\xff]+)'
+)
+
+def extract_bytes(path: str, data: Any) -> List[Dict[str, Any]]:
+    """Extract from `data`, the file's content as bytes or any buffer (e.g. an mmap)."""
     api_model: List[Dict[str, Any]] = []
-    for path in files:
-        try:
-            with open(path, encoding="utf-8") as f:
-                text = f.read()
-        except Exception:
-            continue
 
-        package_match = PACKAGE_PATTERN.search(text)
-        package = package_match.group(1) if package_match else ""
-
-        for c in CLASS_PATTERN.finditer(text):
-            class_name = c.group(1)
-            container = f"{package}.{class_name}" if package else class_name
-            api_model.append({
-                "file": path,
-                "language": "java",
-                "container": container,
-                "container_kind": "class",
-                "summary": "",
-                "members": []
-            })
+    matches = [(last_group(m), group_text(m, m.lastindex)) for m in JAVA_PATTERN.finditer(data)]
 
+    package = ""
+    for kind, name in matches:
+        if kind == "package":
+            package = name
+            continue
+        class_name = name
+        container = f"{package}.{class_name}" if package else class_name
+        api_model.append({
+            "file": path,
+            "language": "java",
+            "container": container,
+            "container_kind": "class",
+            "summary": "",
+            "members": []
+        })
+
+    return api_model
+
+def extract_one(path: str) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        return []
+    with buf:
+        return extract_bytes(path, buf)
+
+def extract(files: List[str]) -> Dict[str, Any]:
+    api_model: List[Dict[str, Any]] = []
+    for path in files:
+        api_model.extend(extract_one(path))
     return {"api_model": api_model}
@@ -4,50 +4,59 @@
 Minimal heuristic-based extractor for JavaScript.
 """
 
-import re
+import mmap
 import os
 from typing import Dict, Any, List
 
-EXPORT_FUNC = re.compile(r'export\s+function\s+(\w+)\s*\(')
-EXPORT_CONST_FUNC = re.compile(r'export\s+const\s+(\w+)\s*=\s*\(')
+from regex_engine import compile_pattern, group_text
 
-def extract(files: List[str]) -> Dict[str, Any]:
+EXPORT_PATTERN = compile_pattern(
+    rb'export\s+(?:function\s+(?P<func>[\w\x80-\xff]+)\s*\('
+    rb'|const\s+(?P<const_func>[\w\x80-\xff]+)\s*=\s*\()'
+)
+
+def extract_bytes(path: str, data: Any) -> List[Dict[str, Any]]:
+    """Extract from `data`, the file's content as bytes or any buffer (e.g. an mmap)."""
     api_model: List[Dict[str, Any]] = []
 
-    for path in files:
-        try:
-            with open(path, encoding="utf-8") as f:
-                text = f.read()
-        except Exception:
-            continue
-
-        functions = []
-        for fn in EXPORT_FUNC.finditer(text):
-            functions.append(fn.group(1))
-        for fn in EXPORT_CONST_FUNC.finditer(text):
-            functions.append(fn.group(1))
-
-        if not functions:
-            continue
-
-        members = []
-        for name in functions:
-            members.append({
-                "name": name,
-                "kind": "function",
-                "visibility": "public",
-                "parameters": [],
-                "returns": "unknown",
-                "summary": ""
-            })
-
-        api_model.append({
-            "file": path,
-            "language": "javascript",
-            "container": os.path.basename(path),
-            "container_kind": "module",
-            "summary": "",
-            "members": members
+    functions = [group_text(fn, fn.lastindex) for fn in EXPORT_PATTERN.finditer(data)]
+
+    if not functions:
+        return api_model
+
+    members = []
+    for name in functions:
+        members.append({
+            "name": name,
+            "kind": "function",
+            "visibility": "public",
+            "parameters": [],
+            "returns": "unknown",
+            "summary": ""
         })
 
+    api_model.append({
+        "file": path,
+        "language": "javascript",
+        "container": os.path.basename(path),
+        "container_kind": "module",
+        "summary": "",
+        "members": members
+    })
+
+    return api_model
+
+def extract_one(path: str) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        return []
+    with buf:
+        return extract_bytes(path, buf)
+
+def extract(files: List[str]) -> Dict[str, Any]:
+    api_model: List[Dict[str, Any]] = []
+    for path in files:
+        api_model.extend(extract_one(path))
     return {"api_model": api_model}
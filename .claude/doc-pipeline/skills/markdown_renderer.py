@@ -4,10 +4,19 @@
 Skill: render_api_docs
 
 Language-agnostic API doc renderer.
+
+Pages are written synchronously as they are rendered: rendering is CPU-bound
+Python, so handing each small write to another thread costs more in GIL
+hand-off than it overlaps. Template text and the default placeholder texts
+are encoded once; only the per-item values are encoded for each page.
 """
 
+import functools
 import os
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, Iterator, List, Tuple, Union
+
+from api_model import ApiModel
 
 TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "..", "templates", "api_reference_template.md")
 
@@ -15,37 +24,97 @@ def load_template() -> str:
     with open(TEMPLATE_PATH, encoding="utf-8") as f:
         return f.read()
 
-def render_api_docs(api_model: List[Dict[str, Any]], docs_root: str) -> Dict[str, Any]:
-    template = load_template()
-    os.makedirs(docs_root, exist_ok=True)
-    generated_files: List[str] = []
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+def split_template(template: str) -> List[str]:
+    """Split a template into segments: even indices are literal text, odd
+    indices are placeholder names."""
+    return PLACEHOLDER_PATTERN.split(template)
+
+@functools.lru_cache(maxsize=None)
+def _template_segments() -> List[str]:
+    # The template path is fixed, so read and split it once per process.
+    return split_template(load_template())
+
+@functools.lru_cache(maxsize=None)
+def _encoded_segments() -> List[Any]:
+    # Literal segments as UTF-8 bytes; placeholder names stay `str` keys.
+    return [s.encode("utf-8") if i % 2 == 0 else s for i, s in enumerate(_template_segments())]
+
+NO_SUMMARY = "_No summary available._".encode("utf-8")
+NO_MEMBERS = "_No public members detected._".encode("utf-8")
+
+@functools.lru_cache(maxsize=1024)
+def _encode(text: str) -> bytes:
+    # For low-cardinality values such as language and container kind.
+    return text.encode("utf-8")
+
+def _fill(segments: List[Any], values: Dict[str, bytes]) -> Iterator[bytes]:
+    for i, segment in enumerate(segments):
+        if i % 2 == 0:
+            yield segment
+        else:
+            value = values.get(segment)
+            # Placeholders without a value are written back unchanged.
+            yield value if value is not None else b"{{" + segment.encode("utf-8") + b"}}"
+
+MEMBER_LINE = "- `%s(...)` — %s"
+# Most members have no summary; this form needs no trailing-space strip.
+MEMBER_LINE_BARE = "- `%s(...)` —"
+
+Row = Tuple[str, str, str, str, List[str], List[str]]
+
+def _rows(api_model: Union[ApiModel, List[Dict[str, Any]]]) -> Iterator[Row]:
+    """(language, container, container_kind, summary, member names, member
+    summaries) per item, read from the columns or from plain item dicts
+    without converting one form into the other."""
+    if isinstance(api_model, ApiModel):
+        offsets = api_model.member_offsets
+        member_names = api_model.member_names
+        member_summaries = api_model.member_summaries
+        for i in range(len(api_model)):
+            lo, hi = offsets[i], offsets[i + 1]
+            yield (api_model.languages[i], api_model.containers[i], api_model.container_kinds[i],
+                   api_model.summaries[i], member_names[lo:hi], member_summaries[lo:hi])
+        return
 
     for item in api_model:
-        language = item.get("language", "unknown")
-        container = item.get("container", "UnknownContainer")
-        container_kind = item.get("container_kind", "unknown")
-        summary = item.get("summary", "")
         members = item.get("members", [])
+        yield (item.get("language", "unknown"), item.get("container", "UnknownContainer"),
+               item.get("container_kind", "unknown"), item.get("summary", ""),
+               [m["name"] for m in members], [m.get("summary", "") for m in members])
 
-        members_lines = []
-        for m in members:
-            sig = m["name"] + "(...)"
-            members_lines.append(f"- `{sig}` — {m.get('summary','')}".rstrip())
-        members_section = "\n".join(members_lines) if members_lines else "_No public members detected._"
+def render_api_docs(api_model: Union[ApiModel, List[Dict[str, Any]]], docs_root: str) -> Dict[str, Any]:
+    segments = _encoded_segments()
+    os.makedirs(docs_root, exist_ok=True)
+    generated_files: List[str] = []
 
-        content = template
-        content = content.replace("{{LANGUAGE}}", language)
-        content = content.replace("{{CONTAINER}}", container)
-        content = content.replace("{{CONTAINER_KIND}}", container_kind)
-        content = content.replace("{{SUMMARY}}", summary or "_No summary available._")
-        content = content.replace("{{MEMBERS_SECTION}}", members_section)
+    for language, container, container_kind, summary, names, summaries in _rows(api_model):
+        if not names:
+            members_section = NO_MEMBERS
+        else:
+            members_lines = [""] * len(names)
+            for k, (name, member_summary) in enumerate(zip(names, summaries)):
+                if member_summary:
+                    members_lines[k] = (MEMBER_LINE % (name, member_summary)).rstrip()
+                else:
+                    members_lines[k] = MEMBER_LINE_BARE % name
+            members_section = "\n".join(members_lines).encode("utf-8")
+
+        values = {
+            "LANGUAGE": _encode(language),
+            "CONTAINER": container.encode("utf-8"),
+            "CONTAINER_KIND": _encode(container_kind),
+            "SUMMARY": summary.encode("utf-8") if summary else NO_SUMMARY,
+            "MEMBERS_SECTION": members_section,
+        }
 
         safe_name = container.replace(" ", "_").replace("/", "_")
         out_path = os.path.join(docs_root, safe_name + ".md")
 
-        with open(out_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
+        content = b"".join(_fill(segments, values))
         generated_files.append(out_path)
+        with open(out_path, "wb") as f:
+            f.write(content)
 
     return {"generated_files": generated_files}
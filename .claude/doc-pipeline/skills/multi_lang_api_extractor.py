@@ -4,12 +4,34 @@
 Skill: extract_api
 
 Routes files by inferred programming language and calls language-specific
-adapters, then normalizes their outputs into a single `api_model`.
+adapters, then normalizes their outputs into a single columnar `ApiModel`.
+`extract_items` returns the same items as a plain list for JSON boundaries,
+without building the columns.
+
+Files are extracted independently, so `(adapter, path)` units are fanned out
+across a process pool once the manifest is large enough to amortize startup.
+
+Results are cached per file under `.cache/extract.json`, indexed by absolute
+path and keyed by adapter, mtime and size, so warm runs only re-extract files
+that changed. The cache is shared by every scanned root and bounded: each
+entry records the cache generation that last used it, and the least recently
+used entries beyond `MAX_CACHE_ENTRIES` are evicted. Entries this call did
+not touch are never stat-ed.
+
+Source files are read once at this boundary and handed to adapters as bytes
+(`extract_bytes`); in-process runs prefetch reads on a small thread pool so
+disk I/O overlaps parsing.
 """
 
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+import functools
+import importlib
+import json
 import os
+import tempfile
 
+from api_model import ApiModel
 import csharp_api_extractor
 import typescript_api_extractor
 import javascript_api_extractor
@@ -27,7 +49,80 @@ ADAPTERS = {
     "go": go_api_extractor
 }
 
-def extract_api(manifest: Dict[str, Any]) -> Dict[str, Any]:
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", ".cache", "extract.json")
+# Bump whenever an adapter's output changes so stale fragments are discarded.
+CACHE_VERSION = 4
+MAX_CACHE_ENTRIES = 20000
+
+# Below this many files the pool startup costs more than it saves.
+PARALLEL_MIN_FILES = 64
+CHUNKSIZE = 32
+PREFETCH_WORKERS = 4
+
+@functools.lru_cache(maxsize=256)
+def _read_file_bytes(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _load(task: Tuple[str, str]) -> Optional[bytes]:
+    adapter_name, path = task
+    if not getattr(importlib.import_module(adapter_name), "READS_SOURCE", True):
+        return b""
+    return _read_file_bytes(path)
+
+def _extract(task: Tuple[str, str], data: Optional[bytes]) -> List[Dict[str, Any]]:
+    adapter_name, path = task
+    if data is None:
+        return []
+    return importlib.import_module(adapter_name).extract_bytes(path, data)
+
+def _worker(task: Tuple[str, str]) -> List[Dict[str, Any]]:
+    return _extract(task, _load(task))
+
+def _load_cache(cache_path: str) -> Tuple[int, Dict[str, Any]]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return 0, {}
+    if cache.get("version") != CACHE_VERSION:
+        return 0, {}
+    return cache.get("generation", 0), cache.get("files", {})
+
+def _evict(files: Dict[str, Any]) -> Dict[str, Any]:
+    if len(files) <= MAX_CACHE_ENTRIES:
+        return files
+    newest = sorted(files, key=lambda p: files[p].get("used", 0), reverse=True)
+    return {p: files[p] for p in newest[:MAX_CACHE_ENTRIES]}
+
+def _save_cache(cache_path: str, generation: int, files: Dict[str, Any]) -> None:
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    # A private temp file per call, so concurrent saves never share one.
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix="extract.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "generation": generation, "files": files}, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _cache_key(adapter_name: str, path: str) -> Optional[List[Any]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    # The path as given is part of the key because it is echoed in the items' "file".
+    return [adapter_name, path, st.st_mtime_ns, st.st_size]
+
+def extract_items(manifest: Dict[str, Any], cache_path: Optional[str] = CACHE_PATH) -> List[Dict[str, Any]]:
     sources = manifest.get("sources", [])
     by_lang: Dict[str, List[str]] = {}
     for src in sources:
@@ -37,15 +132,69 @@ def extract_api(manifest: Dict[str, Any]) -> Dict[str, Any]:
             continue
         by_lang.setdefault(lang, []).append(path)
 
-    api_model: List[Dict[str, Any]] = []
-
+    tasks: List[Tuple[str, str]] = []
     for lang, files in by_lang.items():
-        if lang in ADAPTERS:
-            adapter = ADAPTERS[lang]
+        adapter = ADAPTERS.get(lang, generic_fallback_extractor)
+        tasks.extend((adapter.__name__, path) for path in files)
+
+    generation, cached = _load_cache(cache_path) if cache_path else (0, {})
+    # Entries used by this call; only these are stat-ed and restamped.
+    touched: Dict[str, Any] = {}
+    gone: List[str] = []
+    # A hit stamped before the latest save needs restamping to stay recent.
+    stale = False
+    abs_paths = [os.path.abspath(path) for _, path in tasks]
+    results: List[Optional[List[Dict[str, Any]]]] = [None] * len(tasks)
+    keys: List[Optional[List[Any]]] = [None] * len(tasks)
+    misses: List[int] = []
+
+    for i, (adapter_name, path) in enumerate(tasks):
+        key = _cache_key(adapter_name, path) if cache_path else None
+        entry = cached.get(abs_paths[i])
+        if key is not None and entry is not None and entry.get("key") == key:
+            results[i] = entry["api_model"]
+            touched[abs_paths[i]] = entry
+            stale = stale or entry.get("used", 0) < generation
         else:
-            adapter = generic_fallback_extractor
-        result = adapter.extract(files)
-        # each adapter returns {"api_model": [...]}
-        api_model.extend(result.get("api_model", []))
+            keys[i] = key
+            misses.append(i)
+            if key is None and entry is not None:
+                gone.append(abs_paths[i])
+
+    # Contents may have changed since an earlier call in this process, and
+    # cached bytes should not outlive the call in a long-running server.
+    _read_file_bytes.cache_clear()
+    miss_tasks = [tasks[i] for i in misses]
+    try:
+        if len(miss_tasks) < PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as readers:
+                extracted = [_extract(task, data) for task, data in zip(miss_tasks, readers.map(_load, miss_tasks))]
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                extracted = list(executor.map(_worker, miss_tasks, chunksize=CHUNKSIZE))
+    finally:
+        _read_file_bytes.cache_clear()
+
+    for i, items in zip(misses, extracted):
+        results[i] = items
+        if keys[i] is not None:
+            touched[abs_paths[i]] = {"key": keys[i], "api_model": items}
+
+    stored = any(keys[i] is not None for i in misses)
+    if cache_path and (stored or gone or stale):
+        generation += 1
+        for entry in touched.values():
+            entry["used"] = generation
+        for abs_path in gone:
+            cached.pop(abs_path, None)
+        # Entries from other roots are kept until evicted.
+        cached.update(touched)
+        try:
+            _save_cache(cache_path, generation, _evict(cached))
+        except OSError:
+            pass
+
+    return [item for items in results for item in items]
 
-    return {"api_model": api_model}
+def extract_api(manifest: Dict[str, Any], cache_path: Optional[str] = CACHE_PATH) -> Dict[str, Any]:
+    return {"api_model": ApiModel.from_items(extract_items(manifest, cache_path))}
@@ -1,61 +1,80 @@
 
 """python_api_extractor.py
 
-Minimal heuristic-based extractor for Python.
+Extractor for Python built on the stdlib `ast` module.
+
+Parsing (rather than pattern matching) picks up `class Foo:` without bases,
+decorated and `async def` functions, and ignores look-alikes inside strings
+and comments. The first line of each docstring is used as the summary.
 """
 
-import re
+import ast
 import os
 from typing import Dict, Any, List
 
-CLASS_PATTERN = re.compile(r'^class\s+(\w+)\s*\(', re.MULTILINE)
-DEF_PATTERN = re.compile(r'^def\s+(\w+)\s*\(', re.MULTILINE)
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
 
-def extract(files: List[str]) -> Dict[str, Any]:
-    api_model: List[Dict[str, Any]] = []
+def _summary(node: ast.AST) -> str:
+    doc = ast.get_docstring(node)
+    return doc.splitlines()[0] if doc else ""
 
-    for path in files:
-        try:
-            with open(path, encoding="utf-8") as f:
-                text = f.read()
-        except Exception:
-            continue
+def _public_functions(body: List[ast.stmt], kind: str) -> List[Dict[str, Any]]:
+    members = []
+    for node in body:
+        if isinstance(node, FUNCTION_NODES) and not node.name.startswith("_"):
+            members.append({
+                "name": node.name,
+                "kind": kind,
+                "visibility": "public",
+                "parameters": [],
+                "returns": "unknown",
+                "summary": _summary(node)
+            })
+    return members
 
-        classes = CLASS_PATTERN.findall(text)
-        funcs = DEF_PATTERN.findall(text)
+def extract_bytes(path: str, data: bytes) -> List[Dict[str, Any]]:
+    api_model: List[Dict[str, Any]] = []
+    try:
+        tree = ast.parse(data, path)
+    except Exception:
+        return api_model
 
-        module_name = os.path.splitext(os.path.basename(path))[0]
+    module_name = os.path.splitext(os.path.basename(path))[0]
 
-        for class_name in classes:
-            container = f"{module_name}.{class_name}"
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
             api_model.append({
                 "file": path,
                 "language": "python",
-                "container": container,
+                "container": f"{module_name}.{node.name}",
                 "container_kind": "class",
-                "summary": "",
-                "members": []
+                "summary": _summary(node),
+                "members": _public_functions(node.body, "method")
             })
 
-        public_funcs = [f for f in funcs if not f.startswith("_")]
-        if public_funcs:
-            members = []
-            for name in public_funcs:
-                members.append({
-                    "name": name,
-                    "kind": "function",
-                    "visibility": "public",
-                    "parameters": [],
-                    "returns": "unknown",
-                    "summary": ""
-                })
-            api_model.append({
-                "file": path,
-                "language": "python",
-                "container": module_name,
-                "container_kind": "module",
-                "summary": "",
-                "members": members
-            })
+    members = _public_functions(tree.body, "function")
+    if members:
+        api_model.append({
+            "file": path,
+            "language": "python",
+            "container": module_name,
+            "container_kind": "module",
+            "summary": _summary(tree),
+            "members": members
+        })
+
+    return api_model
+
+def extract_one(path: str) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except Exception:
+        return []
+    return extract_bytes(path, data)
 
+def extract(files: List[str]) -> Dict[str, Any]:
+    api_model: List[Dict[str, Any]] = []
+    for path in files:
+        api_model.extend(extract_one(path))
     return {"api_model": api_model}
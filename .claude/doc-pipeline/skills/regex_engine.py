@@ -0,0 +1,39 @@
+
+"""regex_engine.py
+
+Shared pattern compiler for the language extractors.
+
+Uses google-re2 (linear-time DFA matching, no backtracking blowup) when it is
+installed and falls back to the stdlib `re` module otherwise, or for any
+pattern RE2 cannot express. Patterns should carry their flags inline
+(e.g. `(?m)`) so they compile identically under both engines.
+
+Extractors scan raw bytes, and RE2 reports bytes group names for bytes
+patterns, so matches are read through `last_group` and `group_text` rather
+than `Match.lastgroup` / `Match.group` directly.
+"""
+
+import re
+from typing import Any
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def compile_pattern(pattern: bytes) -> Any:
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+def last_group(match: Any) -> str:
+    """Name of the named group that closed last in `match`, as `str`."""
+    name = match.lastgroup
+    return name.decode("ascii") if isinstance(name, bytes) else name
+
+def group_text(match: Any, group: int = 1) -> str:
+    """Decode a captured group; only the capture is decoded, never the file."""
+    return match.group(group).decode("utf-8", "replace")
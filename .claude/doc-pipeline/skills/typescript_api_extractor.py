@@ -4,58 +4,72 @@
 Minimal heuristic-based extractor for TypeScript.
 """
 
-import re
+import mmap
+import os
 from typing import Dict, Any, List
 
-EXPORT_CLASS = re.compile(r'export\s+class\s+(\w+)')
-EXPORT_FUNC = re.compile(r'export\s+function\s+(\w+)\s*\(')
+from regex_engine import compile_pattern, group_text, last_group
 
-def extract(files: List[str]) -> Dict[str, Any]:
+EXPORT_PATTERN = compile_pattern(
+    rb'export\s+(?:class\s+(?P<cls>[\w\x80-\xff]+)'
+    rb'|function\s+(?P<func>[\w\x80-\xff]+)\s*\()'
+)
+
+def extract_bytes(path: str, data: Any) -> List[Dict[str, Any]]:
+    """Extract from `data`, the file's content as bytes or any buffer (e.g. an mmap)."""
     api_model: List[Dict[str, Any]] = []
 
-    for path in files:
-        try:
-            with open(path, encoding="utf-8") as f:
-                text = f.read()
-        except Exception:
-            continue
-
-        classes = []
-        for c in EXPORT_CLASS.finditer(text):
-            classes.append(c.group(1))
-
-        functions = []
-        for fn in EXPORT_FUNC.finditer(text):
-            functions.append(fn.group(1))
-
-        for class_name in classes:
-            api_model.append({
-                "file": path,
-                "language": "typescript",
-                "container": class_name,
-                "container_kind": "class",
-                "summary": "",
-                "members": [],
-            })
+    classes = []
+    functions = []
+    for m in EXPORT_PATTERN.finditer(data):
+        if last_group(m) == "cls":
+            classes.append(group_text(m, m.lastindex))
+        else:
+            functions.append(group_text(m, m.lastindex))
+
+    for class_name in classes:
+        api_model.append({
+            "file": path,
+            "language": "typescript",
+            "container": class_name,
+            "container_kind": "class",
+            "summary": "",
+            "members": [],
+        })
 
-        if functions:
-            members = []
-            for fn_name in functions:
-                members.append({
-                    "name": fn_name,
-                    "kind": "function",
-                    "visibility": "public",
-                    "parameters": [],
-                    "returns": "unknown",
-                    "summary": ""
-                })
-            api_model.append({
-                "file": path,
-                "language": "typescript",
-                "container": os.path.basename(path),
-                "container_kind": "module",
-                "summary": "",
-                "members": members
+    if functions:
+        members = []
+        for fn_name in functions:
+            members.append({
+                "name": fn_name,
+                "kind": "function",
+                "visibility": "public",
+                "parameters": [],
+                "returns": "unknown",
+                "summary": ""
             })
+        api_model.append({
+            "file": path,
+            "language": "typescript",
+            "container": os.path.basename(path),
+            "container_kind": "module",
+            "summary": "",
+            "members": members
+        })
 
+    return api_model
+
+def extract_one(path: str) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        return []
+    with buf:
+        return extract_bytes(path, buf)
+
+def extract(files: List[str]) -> Dict[str, Any]:
+    api_model: List[Dict[str, Any]] = []
+    for path in files:
+        api_model.extend(extract_one(path))
     return {"api_model": api_model}
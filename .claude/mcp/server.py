@@ -38,6 +38,10 @@ def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
         diffs = diff_scanner.scan_changes(manifest)
         return {"diffs": diffs}
 
+    if tool == "diff_scanner.hash":
+        manifest = params.get("manifest") or manifest_builder.build_repo_manifest(PIPELINE_ROOT)
+        return {"file_hashes": diff_scanner.compute_file_hashes(manifest)}
+
     if tool == "test_executor.run_all":
         tech_stack = params.get("tech_stack") or tech_stack_detector.detect_stack(PIPELINE_ROOT)
         results = test_executor.run_all_tests(tech_stack)
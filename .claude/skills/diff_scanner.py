@@ -4,22 +4,66 @@
 Responsibility:
 - Compare current manifest against what is stored in state.
 - Identify changed, added, or removed files for targeted processing.
+
+A file present in both manifests is only reported as modified when its content
+hash differs from the one stored in state under `file_hashes` (as produced by
+`compute_file_hashes`), or when no hash was stored for it. Each stored hash
+carries the file's mtime and size, and files whose stat is unchanged are not
+re-read.
 """
 
 import os
 import json
-from typing import Dict, Any, List
+import hashlib
+from typing import Dict, Any, List, Optional
 
 STATE_PATH = os.path.join(os.path.dirname(__file__), "..", "state", "pipeline_state.json")
 
+AREA_KEYS = (
+    ("backend", "backend_files"),
+    ("frontend", "frontend_files"),
+    ("e2e", "e2e_files"),
+)
+
+def file_hash(path: str) -> Optional[str]:
+    digest = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def _stat_key(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def compute_file_hashes(manifest: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Content hash, mtime and size for every file in `manifest`, to be saved
+    in state as `file_hashes` next to `last_manifest`."""
+    hashes: Dict[str, Dict[str, Any]] = {}
+    for area, key in AREA_KEYS:
+        for path in manifest.get(area, {}).get(key, []):
+            stat_key = _stat_key(path)
+            digest = file_hash(path)
+            if stat_key is not None and digest is not None:
+                hashes[path] = {"sha1": digest, "mtime_ns": stat_key[0], "size": stat_key[1]}
+    return hashes
+
 def scan_changes(manifest: Dict[str, Any]) -> Dict[str, List[Dict[str, str]]]:
     # Load last manifest from state if available
     try:
         with open(STATE_PATH, encoding="utf-8") as f:
             state = json.load(f)
         last_manifest = state.get("last_manifest", {})
+        last_hashes = state.get("file_hashes", {})
     except FileNotFoundError:
         last_manifest = {}
+        last_hashes = {}
 
     changes = {
         "backend": [],
@@ -27,30 +71,45 @@ def scan_changes(manifest: Dict[str, Any]) -> Dict[str, List[Dict[str, str]]]:
         "e2e": []
     }
 
+    def is_modified(path):
+        stored = last_hashes.get(path)
+        if stored is None:
+            return True
+        if isinstance(stored, str):
+            # Older state stored the bare hash without stat information.
+            return file_hash(path) != stored
+        if _stat_key(path) == [stored.get("mtime_ns"), stored.get("size")]:
+            return False
+        return file_hash(path) != stored.get("sha1")
+
     def compute_diff(current_list, last_list, area):
-        last_set = set(last_list)
-        curr_set = set(current_list)
-        for added in curr_set - last_set:
-            changes[area].append({"file": added, "change_type": "added"})
-        for removed in last_set - curr_set:
-            changes[area].append({"file": removed, "change_type": "removed"})
-        for common in curr_set & last_set:
-            changes[area].append({"file": common, "change_type": "modified"})  # Simplified
-
-    compute_diff(
-        manifest.get("backend", {}).get("backend_files", []),
-        last_manifest.get("backend", {}).get("backend_files", []),
-        "backend",
-    )
-    compute_diff(
-        manifest.get("frontend", {}).get("frontend_files", []),
-        last_manifest.get("frontend", {}).get("frontend_files", []),
-        "frontend",
-    )
-    compute_diff(
-        manifest.get("e2e", {}).get("e2e_files", []),
-        last_manifest.get("e2e", {}).get("e2e_files", []),
-        "e2e",
-    )
+        # One merge over both sorted lists classifies every path.
+        curr = sorted(set(current_list))
+        last = sorted(set(last_list))
+        out = changes[area]
+        i = j = 0
+        while i < len(curr) and j < len(last):
+            if curr[i] == last[j]:
+                if is_modified(curr[i]):
+                    out.append({"file": curr[i], "change_type": "modified"})
+                i += 1
+                j += 1
+            elif curr[i] < last[j]:
+                out.append({"file": curr[i], "change_type": "added"})
+                i += 1
+            else:
+                out.append({"file": last[j], "change_type": "removed"})
+                j += 1
+        for added in curr[i:]:
+            out.append({"file": added, "change_type": "added"})
+        for removed in last[j:]:
+            out.append({"file": removed, "change_type": "removed"})
+
+    for area, key in AREA_KEYS:
+        compute_diff(
+            manifest.get(area, {}).get(key, []),
+            last_manifest.get(area, {}).get(key, []),
+            area,
+        )
 
     return changes
@@ -7,39 +7,69 @@ Responsibility:
 """
 
 import json
-import glob
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Iterator
+
+# Dependency and build output never holds the project's own test config.
+EXCLUDED_DIRS = {"node_modules", "bin", "obj"}
+
+def _walk(root: str) -> Iterator[os.DirEntry]:
+    """Yield file entries below `root`, pruning excluded and hidden directories
+    (recursive glob never descended into hidden directories either)."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in EXCLUDED_DIRS or entry.name.startswith("."):
+                    continue
+                yield from _walk(entry.path)
+            elif entry.is_file():
+                yield entry
 
 def detect_stack(root: str = ".") -> Dict[str, Any]:
     backend = {"framework": None}
     frontend = {"runner": None}
     e2e = {"framework": None, "language": "typescript"}
 
-    # Detect backend test framework via csproj references
-    for csproj in glob.glob(root + "/**/*.csproj", recursive=True):
-        with open(csproj, encoding="utf-8") as f:
-            text = f.read().lower()
-        if "nunit.framework" in text:
-            backend["framework"] = "nunit"
-        elif "xunit" in text:
-            backend["framework"] = "xunit"
-
-    # Detect frontend runner via package.json
-    for pkg in glob.glob(root + "/**/package.json", recursive=True):
-        try:
-            with open(pkg, encoding="utf-8") as f:
-                data = json.load(f)
-            deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-            if "jest" in deps:
-                frontend["runner"] = "jest"
-            elif "karma" in deps:
-                frontend["runner"] = "karma"
-        except Exception:
-            continue
-
-    # Detect playwright
-    for pw_cfg in glob.glob(root + "/**/playwright.config.*", recursive=True):
-        e2e["framework"] = "playwright"
+    # Single pass over the tree; stop as soon as every slot is filled.
+    for entry in _walk(root):
+        name = entry.name
+
+        # Detect backend test framework via csproj references
+        if name.endswith(".csproj"):
+            if backend["framework"] is not None:
+                continue
+            with open(entry.path, encoding="utf-8") as f:
+                text = f.read().lower()
+            if "nunit.framework" in text:
+                backend["framework"] = "nunit"
+            elif "xunit" in text:
+                backend["framework"] = "xunit"
+
+        # Detect frontend runner via package.json
+        elif name == "package.json":
+            if frontend["runner"] is not None:
+                continue
+            try:
+                with open(entry.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+                if "jest" in deps:
+                    frontend["runner"] = "jest"
+                elif "karma" in deps:
+                    frontend["runner"] = "karma"
+            except Exception:
+                continue
+
+        # Detect playwright
+        elif name.startswith("playwright.config."):
+            e2e["framework"] = "playwright"
+
+        if backend["framework"] and frontend["runner"] and e2e["framework"]:
+            break
 
     return {
         "backend": backend,
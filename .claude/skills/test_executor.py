@@ -5,12 +5,69 @@ Responsibility:
 - Run backend, frontend, and E2E test commands.
 - Summarize results in a structured JSON format.
 
+The three suites have no ordering constraints, so they are launched together
+and their output pipes are drained concurrently; wall time is that of the
+slowest suite rather than the sum.
+
 NOTE:
 - This is a skeleton using simple subprocess calls. Adapt commands to your environment.
 """
 
 import subprocess
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+def _frontend_command(tech_stack: Dict[str, Any]) -> Optional[List[str]]:
+    runner = tech_stack.get("frontend", {}).get("runner")
+    if runner == "jest":
+        return ["npx", "jest", "--runInBand"]
+    if runner == "karma":
+        return ["npx", "karma", "start", "--single-run"]
+    return None
+
+def _launch(cmd: List[str]) -> Any:
+    """Start `cmd` with captured output; returns the process or the launch error."""
+    try:
+        return subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8", errors="replace"
+        )
+    except Exception as exc:
+        return exc
+
+def _collect(results: Dict[str, Any], area: str, cmd: List[str], proc: Any) -> None:
+    if isinstance(proc, Exception):
+        results[area]["failed"] += 1
+        results[area]["failures"].append({"error": str(proc)})
+        return
+
+    try:
+        stdout, stderr = proc.communicate()
+    except Exception as exc:
+        # Never leave a suite running or let it abort collection of the others.
+        proc.kill()
+        proc.wait()
+        results[area]["failed"] += 1
+        results[area]["failures"].append({"error": str(exc)})
+        return
+
+    # In a real implementation, parse stdout to fill passed/failed
+    if proc.returncode != 0:
+        exc = subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+        results[area]["failed"] += 1
+        results[area]["failures"].append({"error": str(exc), "output": stderr or stdout})
+
+def _run_suites(results: Dict[str, Any], commands: Dict[str, List[str]]) -> None:
+    running = {area: _launch(cmd) for area, cmd in commands.items()}
+
+    # One collector per suite, so a suite filling its pipe never waits on
+    # another suite being collected first.
+    with ThreadPoolExecutor(max_workers=max(len(running), 1)) as collectors:
+        futures = [
+            collectors.submit(_collect, results, area, commands[area], proc)
+            for area, proc in running.items()
+        ]
+        for future in futures:
+            future.result()
 
 def run_all_tests(tech_stack: Dict[str, Any]) -> Dict[str, Any]:
     results: Dict[str, Any] = {
@@ -20,36 +77,14 @@ def run_all_tests(tech_stack: Dict[str, Any]) -> Dict[str, Any]:
         "e2e": {"passed": 0, "failed": 0, "failures": []},
     }
 
-    # Backend
-    try:
-        # Example command; replace with your actual test runner command
-        subprocess.run(["dotnet", "test"], check=True)
-        # In a real implementation, parse the output to fill passed/failed
-    except Exception as exc:
-        results["backend"]["failed"] += 1
-        results["backend"]["failures"].append({"error": str(exc)})
-
-    # Frontend
-    if tech_stack.get("frontend", {}).get("runner") == "jest":
-        cmd = ["npx", "jest", "--runInBand"]
-    elif tech_stack.get("frontend", {}).get("runner") == "karma":
-        cmd = ["npx", "karma", "start", "--single-run"]
-    else:
-        cmd = None
-
-    if cmd:
-        try:
-            subprocess.run(cmd, check=True)
-        except Exception as exc:
-            results["frontend"]["failed"] += 1
-            results["frontend"]["failures"].append({"error": str(exc)})
-
-    # E2E
+    # Example commands; replace with your actual test runner commands
+    commands: Dict[str, List[str]] = {"backend": ["dotnet", "test"]}
+    frontend_cmd = _frontend_command(tech_stack)
+    if frontend_cmd:
+        commands["frontend"] = frontend_cmd
     if tech_stack.get("e2e", {}).get("framework") == "playwright":
-        try:
-            subprocess.run(["npx", "playwright", "test"], check=True)
-        except Exception as exc:
-            results["e2e"]["failed"] += 1
-            results["e2e"]["failures"].append({"error": str(exc)})
+        commands["e2e"] = ["npx", "playwright", "test"]
+
+    _run_suites(results, commands)
 
     return results
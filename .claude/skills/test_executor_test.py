@@ -0,0 +1,48 @@
+
+"""Tests for the concurrent suite runner in test_executor."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import test_executor
+
+SLEEP_SECONDS = 2.0
+
+def _results():
+    return {area: {"passed": 0, "failed": 0, "failures": []} for area in ("backend", "frontend", "e2e")}
+
+def _suite(code):
+    return [sys.executable, "-c", code]
+
+def test_suites_with_large_output_run_concurrently():
+    # The first suite writes well past the pipe buffer before sleeping, which
+    # would stall it if the pipes were drained one suite at a time.
+    commands = {
+        "backend": _suite("import time; time.sleep(%s)" % SLEEP_SECONDS),
+        "frontend": _suite("import sys, time; sys.stdout.write('x' * 300000); sys.stdout.flush(); time.sleep(%s)" % SLEEP_SECONDS),
+    }
+    results = _results()
+
+    start = time.monotonic()
+    test_executor._run_suites(results, commands)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < SLEEP_SECONDS * 1.5
+    assert results["backend"]["failed"] == 0
+    assert results["frontend"]["failed"] == 0
+
+def test_failing_and_missing_suites_are_recorded():
+    commands = {
+        "backend": _suite("import sys; sys.stderr.write('boom'); sys.exit(1)"),
+        "e2e": ["definitely-not-a-test-runner"],
+    }
+    results = _results()
+
+    test_executor._run_suites(results, commands)
+
+    assert results["backend"]["failed"] == 1
+    assert results["backend"]["failures"][0]["output"] == "boom"
+    assert results["e2e"]["failed"] == 1